@@ -27,4 +27,32 @@ def clean_schedule_df(csv_path):
     except Exception as e:
         print(f"Error reading the CSV file: {e}")
         return None
-    
\ No newline at end of file
+    
+
+# Columns that identify a single shift row when comparing two versions of the schedule.
+SCHEDULE_ROW_KEY = ["Employee Name", "Date", "Start Time"]
+
+def _keyed_schedule_df(df, key):
+    # Index a schedule frame by the key columns plus the occurrence of that key in the frame,
+    # so rows that share a key (e.g. a missing start time) each stay a separate row.
+    occurrence = df.groupby(key, dropna=False).cumcount().rename("Occurrence")
+    return df.set_index(key + [occurrence])
+
+def diff_schedule_df(old_df, new_df, key=SCHEDULE_ROW_KEY):
+    # Function to compare two cleaned schedule frames row by row using the key columns.
+    # Returns (added, removed, changed) frames indexed by key and occurrence, or None if the columns differ.
+    if list(old_df.columns) != list(new_df.columns):
+        return None
+
+    old_keyed = _keyed_schedule_df(old_df, key)
+    new_keyed = _keyed_schedule_df(new_df, key)
+
+    added = new_keyed.loc[new_keyed.index.difference(old_keyed.index, sort=False)]
+    removed = old_keyed.loc[old_keyed.index.difference(new_keyed.index, sort=False)]
+
+    # Compare as strings so NaT/NaN values on both sides count as equal
+    common = new_keyed.index.intersection(old_keyed.index, sort=False)
+    old_common = old_keyed.loc[common].astype(str)
+    new_common = new_keyed.loc[common].astype(str)
+    changed = new_keyed.loc[common[(old_common != new_common).any(axis=1).to_numpy()]]
+    return added, removed, changed
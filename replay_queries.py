@@ -0,0 +1,287 @@
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError: # Not available on Windows
+    resource = None
+
+# The Groq client is created when smart_agent is imported; replay never calls it,
+# so a placeholder key is enough when no real key is configured.
+os.environ.setdefault("GROQ_API_KEY", "replay-stub")
+
+STAGES = ["vector_search", "parameter_extraction", "function_call", "llm_fallback"]
+
+class StubLLMResponse:
+    def __init__(self, content):
+        self.content = content
+
+class StubLLM:
+    # Deterministic stand-in for the Groq client used by llm_fallback.
+    # Returns the recorded response for a query if the log has one, else a fixed apology.
+    default_response = "Sorry, I was not able to find a match for your query. Please try rephrasing it."
+
+    def __init__(self, responses=None):
+        self.responses = responses or {}
+
+    def invoke(self, messages):
+        user_query = messages[-1]["content"]
+        return StubLLMResponse(self.responses.get(user_query, self.default_response))
+
+def load_query_log(log_path):
+    # Load a recorded workload. Accepts a JSON list (e.g. examples.json) or JSON lines, where each
+    # entry has "user_query" and optionally "intent" (the expected intent) and "llm_response".
+    # Without a path, the test queries from smart_agent.main() are used.
+    if log_path is None:
+        from smart_agent import TEST_QUERIES
+        return [{"user_query": query} for query in TEST_QUERIES]
+
+    with open(log_path, 'r') as f:
+        if log_path.endswith(".jsonl"):
+            entries = [json.loads(line) for line in f if line.strip()]
+        else:
+            entries = json.load(f)
+
+    workload = []
+    for entry in entries:
+        query = entry.get("user_query") or entry.get("query")
+        if query:
+            workload.append({
+                "user_query": query,
+                "intent": entry.get("expected_intent", entry.get("intent")),
+                "llm_response": entry.get("llm_response")
+            })
+    return workload
+
+def max_rss_bytes():
+    # High-water mark of the process resident set size, or None where it is not available.
+    # Unlike tracemalloc this includes native allocations such as torch tensors in the embedding model.
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024 # ru_maxrss is in KiB on Linux
+
+class StageRecorder:
+    # Wraps the agent's pipeline stages to record timings, the executed intent and the confidence.
+    def __init__(self, agent):
+        self.agent = agent
+        self.reset()
+        agent.find_similar_intent = self._wrap_search(agent.find_similar_intent)
+        agent.extract_parameters_from_query = self._timed("parameter_extraction", agent.extract_parameters_from_query)
+        agent.llm_fallback = self._wrap_fallback(agent.llm_fallback)
+        agent.function_map = {name: self._wrap_function(name, func) for name, func in agent.function_map.items()}
+
+    def reset(self):
+        self.timings = {stage: 0.0 for stage in STAGES}
+        self.active_stages = []
+        self.intent = None
+        self.confidence = None
+        self.used_llm_fallback = False
+
+    def _timed(self, stage, func):
+        # Stages can nest (llm_fallback calls function_map entries), so time spent in an
+        # inner stage is taken off the outer one and each stage reports only its own time.
+        def wrapper(*args, **kwargs):
+            self.active_stages.append(stage)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self.active_stages.pop()
+                self.timings[stage] += elapsed
+                if self.active_stages:
+                    self.timings[self.active_stages[-1]] -= elapsed
+        return wrapper
+
+    def _wrap_search(self, func):
+        timed = self._timed("vector_search", func)
+        def wrapper(*args, **kwargs):
+            results = timed(*args, **kwargs)
+            if results and self.confidence is None:
+                self.confidence = results[0][1]
+            return results
+        return wrapper
+
+    def _wrap_fallback(self, func):
+        timed = self._timed("llm_fallback", func)
+        def wrapper(*args, **kwargs):
+            self.used_llm_fallback = True
+            return timed(*args, **kwargs)
+        return wrapper
+
+    def _wrap_function(self, name, func):
+        timed = self._timed("function_call", func)
+        def wrapper(*args, **kwargs):
+            self.intent = name
+            return timed(*args, **kwargs)
+        return wrapper
+
+def replay(agent, workload, repeat = 3):
+    ## RUN EACH QUERY THROUGH process_user_query AND RECORD INTENT, CONFIDENCE, LATENCY AND PEAK MEMORY
+    agent.llm = StubLLM({entry["user_query"]: entry["llm_response"] for entry in workload if entry.get("llm_response")})
+    recorder = StageRecorder(agent)
+
+    # Some functions change the frame in place, so every run starts from a fresh copy of the loaded schedule
+    base_df = agent.df.copy()
+
+    # Warm up the embedding model so the first query does not carry one-off setup cost
+    agent.df = base_df.copy()
+    agent.process_user_query(workload[0]["user_query"])
+
+    results = []
+    for entry in workload:
+        # Timed runs happen without tracemalloc, since tracing every allocation slows the code down
+        runs = []
+        for _ in range(repeat):
+            agent.df = base_df.copy()
+            recorder.reset()
+            start = time.perf_counter()
+            agent.process_user_query(entry["user_query"])
+            total = time.perf_counter() - start
+            runs.append({"total": total, "stages": dict(recorder.timings)})
+
+        # One separate traced run measures the peak memory of the query: the Python heap peak from
+        # tracemalloc, and how far the query pushed the process RSS high-water mark (0 if it stayed below it)
+        agent.df = base_df.copy()
+        recorder.reset()
+        rss_before = max_rss_bytes()
+        tracemalloc.start()
+        memory_before = tracemalloc.get_traced_memory()[0]
+        agent.process_user_query(entry["user_query"])
+        python_peak = tracemalloc.get_traced_memory()[1] - memory_before
+        tracemalloc.stop()
+        rss_increase = max_rss_bytes() - rss_before if rss_before is not None else None
+
+        latency_ms = {stage: round(statistics.median(run["stages"][stage] for run in runs) * 1000, 3) for stage in STAGES}
+        latency_ms["total"] = round(statistics.median(run["total"] for run in runs) * 1000, 3)
+        results.append({
+            "user_query": entry["user_query"],
+            "expected_intent": entry.get("intent"),
+            "intent": recorder.intent,
+            "confidence": round(recorder.confidence, 4) if recorder.confidence is not None else None,
+            "used_llm_fallback": recorder.used_llm_fallback,
+            "latency_ms": latency_ms,
+            "python_peak_bytes": python_peak,
+            "rss_peak_increase_bytes": rss_increase
+        })
+    agent.df = base_df
+    return results
+
+def intent_accuracy(results):
+    # Share of queries with an expected intent whose executed intent matches, or None if none are labelled.
+    labelled = [result for result in results if result["expected_intent"]]
+    if not labelled:
+        return None
+    return sum(result["intent"] == result["expected_intent"] for result in labelled) / len(labelled)
+
+def _regressed(value, previous, tolerance, floor):
+    # Small absolute differences are noise, so a regression must exceed both the relative and the absolute limit
+    if value is None or previous is None:
+        return False
+    return value > previous * (1 + tolerance) and value - previous > floor
+
+def compare_to_baseline(results, baseline, latency_tolerance = 0.5, latency_floor_ms = 5.0, memory_tolerance = 0.25,
+                        memory_floor_bytes = 64 * 1024, rss_floor_bytes = 16 * 1024 * 1024):
+    ## COMPARE A REPLAY AGAINST A SAVED BASELINE AND RETURN A LIST OF REGRESSIONS
+    regressions = []
+    # Entries are matched on position and query, so a log that repeats a query compares every occurrence
+    baseline_by_entry = {(i, result["user_query"]): result for i, result in enumerate(baseline["results"])}
+
+    # A workload that shrinks (or an entry that no longer parses) must not pass unnoticed
+    replayed_entries = {(i, result["user_query"]) for i, result in enumerate(results)}
+    for i, query in baseline_by_entry:
+        if (i, query) not in replayed_entries:
+            regressions.append(f"Query #{i} '{query}' is in the baseline but was not replayed")
+
+    for i, result in enumerate(results):
+        query = result["user_query"]
+        previous = baseline_by_entry.get((i, query))
+        if previous is None:
+            print(f"Note: query #{i} '{query}' is not in the baseline, skipping comparison.")
+            continue
+
+        if result["intent"] != previous["intent"]:
+            regressions.append(f"Intent changed for '{query}': {previous['intent']} -> {result['intent']}")
+
+        # Each stage is checked on its own, so a slower stage cannot hide behind a faster one in the total
+        for stage, latency in result["latency_ms"].items():
+            previous_latency = previous["latency_ms"].get(stage)
+            if _regressed(latency, previous_latency, latency_tolerance, latency_floor_ms):
+                regressions.append(f"Latency regressed for '{query}' ({stage}): {previous_latency:.1f} ms -> {latency:.1f} ms")
+
+        memory, previous_memory = result["python_peak_bytes"], previous.get("python_peak_bytes")
+        if _regressed(memory, previous_memory, memory_tolerance, memory_floor_bytes):
+            regressions.append(f"Python heap peak regressed for '{query}': {previous_memory} B -> {memory} B")
+
+        rss, previous_rss = result["rss_peak_increase_bytes"], previous.get("rss_peak_increase_bytes")
+        if _regressed(rss, previous_rss, memory_tolerance, rss_floor_bytes):
+            regressions.append(f"RSS high-water increase regressed for '{query}': {previous_rss} B -> {rss} B")
+
+    accuracy, previous_accuracy = intent_accuracy(results), baseline.get("intent_accuracy")
+    if accuracy is not None and previous_accuracy is not None and accuracy < previous_accuracy:
+        regressions.append(f"Intent accuracy dropped: {previous_accuracy:.3f} -> {accuracy:.3f}")
+
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded query log and check it against a saved baseline.")
+    parser.add_argument("--log", help="Query log (.json list or .jsonl). Defaults to the test queries in smart_agent.py")
+    parser.add_argument("--csv", default="./resource/shift_schedule.csv")
+    parser.add_argument("--examples", default="examples.json")
+    parser.add_argument("--baseline", default="replay_baseline.json")
+    parser.add_argument("--save-baseline", action="store_true", help="Write this run as the new baseline instead of comparing")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per query; the median latency is reported")
+    parser.add_argument("--latency-tolerance", type=float, default=0.5, help="Allowed relative latency increase")
+    parser.add_argument("--latency-floor-ms", type=float, default=5.0, help="Latency increases below this are ignored")
+    parser.add_argument("--memory-tolerance", type=float, default=0.25, help="Allowed relative peak memory increase")
+    parser.add_argument("--memory-floor-bytes", type=int, default=64 * 1024, help="Python heap peak increases below this are ignored")
+    parser.add_argument("--rss-floor-bytes", type=int, default=16 * 1024 * 1024, help="RSS high-water increases below this are ignored")
+    args = parser.parse_args()
+
+    workload = load_query_log(args.log)
+    if not workload:
+        sys.exit("Query log is empty.")
+
+    from smart_agent import VectorScheduleAgent
+    agent = VectorScheduleAgent(args.csv, args.examples)
+    results = replay(agent, workload, repeat=max(args.repeat, 1))
+    accuracy = intent_accuracy(results)
+
+    print("\n=== Replay results ===")
+    for result in results:
+        confidence = f"{result['confidence']:.3f}" if result["confidence"] is not None else "-"
+        print(f"{result['latency_ms']['total']:9.1f} ms  {result['python_peak_bytes']:>10} B  "
+              f"conf {confidence}  {result['intent']}  <- {result['user_query']}")
+    if accuracy is not None:
+        print(f"Intent accuracy: {accuracy:.3f}")
+
+    run = {"intent_accuracy": accuracy, "results": results}
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(run, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        sys.exit(f"No baseline found at {args.baseline}. Run with --save-baseline first.")
+    with open(args.baseline, 'r') as f:
+        baseline = json.load(f)
+
+    regressions = compare_to_baseline(results, baseline, args.latency_tolerance, args.latency_floor_ms,
+                                      args.memory_tolerance, args.memory_floor_bytes, args.rss_floor_bytes)
+    if regressions:
+        print("\n=== REGRESSIONS ===")
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        sys.exit(1)
+    print("\nNo regressions against baseline.")
+
+
+if __name__ == "__main__":
+    main()
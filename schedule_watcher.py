@@ -0,0 +1,57 @@
+import os
+import threading
+
+def file_signature(file_path):
+    # Modification time and size of a file, or None if it is missing (e.g. mid-rewrite).
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+class ScheduleFileWatcher:
+    # Polls a file for changes and calls on_change(path) once a rewrite has settled.
+    # on_change returns True once the change is handled; otherwise it is retried on the next poll.
+    # last_signature is the file_signature the caller's data was loaded from (defaults to the current one).
+    def __init__(self, file_path, on_change, poll_interval=5.0, last_signature=None):
+        self.file_path = file_path
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._last_signature = last_signature if last_signature is not None else file_signature(file_path)
+
+    def _run(self):
+        pending = None
+        while not self._stop_event.wait(self.poll_interval):
+            signature = file_signature(self.file_path)
+            if signature is None or signature == self._last_signature:
+                pending = None
+                continue
+            # Only report a change once the file looks the same on two polls in a row,
+            # so a writer that is still rewriting the file is not read half way through.
+            if signature != pending:
+                pending = signature
+                continue
+            try:
+                handled = self.on_change(self.file_path)
+            except Exception as e:
+                print(f"Error handling change to {self.file_path}: {e}")
+                handled = False
+            # Keep pending set on failure so the next poll retries the same version of the file
+            if handled:
+                self._last_signature = signature
+                pending = None
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="ScheduleFileWatcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_interval + 1)
+            self._thread = None
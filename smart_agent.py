@@ -10,9 +10,11 @@ from datetime import date, datetime
 from sentence_transformers import SentenceTransformer
 import faiss
 import pickle
+import threading
 from typing import Dict, List, Tuple
 from langchain_groq import ChatGroq
-from csv_parser import clean_schedule_df
+from csv_parser import clean_schedule_df, diff_schedule_df
+from schedule_watcher import ScheduleFileWatcher, file_signature
 from lookup_functions import *
 from shift_functions import *
 from dotenv import load_dotenv
@@ -28,8 +30,12 @@ llm = ChatGroq(
 class VectorScheduleAgent:
     def __init__(self, csv_file_path, examples_json_path, vector_db_path = "schedule_vector_db"):
         # Load and clean CSV
+        self.csv_file_path = csv_file_path
+        self.csv_signature = file_signature(csv_file_path) # Version of the file self.df was loaded from
         self.df = clean_schedule_df(csv_file_path)
         self.employee_name_list = list(self.df['Employee Name'].dropna().unique()) # Ensure NaN values are dropped
+        self.reload_lock = threading.Lock()
+        self.watcher = None
         print("DataFrame loaded and cleaned")
         
         # Initialize vector database
@@ -124,6 +130,50 @@ class VectorScheduleAgent:
         self.embeddings = db_data['embeddings']
         print(f"Vector database loaded with {len(self.examples)} examples")
     
+    def reload_schedule(self):
+        ## RE-READ THE CSV AND SWAP IN THE NEW SCHEDULE
+        return self._reload_schedule()[1]
+
+    def _reload_schedule(self):
+        # Returns (reloaded, message); reloaded is False if the CSV could not be read.
+        with self.reload_lock:
+            # Take the signature before parsing, so a rewrite during the parse is picked up next time
+            signature = file_signature(self.csv_file_path)
+            new_df = clean_schedule_df(self.csv_file_path)
+            if new_df is None:
+                return False, "Schedule reload skipped: CSV could not be read."
+
+            # The diff only describes the reload; the parsed frame is used as is so rows keep the file's order
+            diff = diff_schedule_df(self.df, new_df)
+            if diff is None:
+                message = "Schedule columns changed, full reload applied."
+            else:
+                added, removed, changed = diff
+                message = f"Schedule reloaded: {len(added)} added, {len(removed)} removed, {len(changed)} changed."
+
+            # Swap in the new frame, so in-flight queries keep the frame they started with
+            self.employee_name_list = list(new_df['Employee Name'].dropna().unique())
+            self.df = new_df
+            self.csv_signature = signature
+            return True, message
+
+    def _on_schedule_file_change(self, path):
+        reloaded, message = self._reload_schedule()
+        print(message)
+        return reloaded
+
+    def start_schedule_watcher(self, poll_interval = 5.0):
+        ## WATCH THE CSV AND RELOAD CHANGES IN THE BACKGROUND
+        # The watcher starts from the version self.df was loaded from, so earlier rewrites are picked up too
+        if self.watcher is None:
+            self.watcher = ScheduleFileWatcher(self.csv_file_path, self._on_schedule_file_change, poll_interval, self.csv_signature)
+        return self.watcher.start()
+
+    def stop_schedule_watcher(self):
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
+
     def find_similar_intent(self, user_query, top_k = 3):
         ## SEARCH FOR SIMILAR INTENT USING VECTOR DATABASE
 
@@ -226,6 +276,7 @@ class VectorScheduleAgent:
     def process_user_query(self, user_query, similarity_threshold = 0.5): #Vector based similarity threshold set to 0.5
         ## USING VECTOR BASED SIMILARITY TO PROCESS USER QUERY AND FIND INTENT OF BEST MATCHING EXAMPLE.
         print(f"Processing query: {user_query}")
+        df = self.df # Keep one version of the schedule for this query even if it is reloaded meanwhile
         
         # Find similar examples
         similar_examples = self.find_similar_intent(user_query, top_k=3)
@@ -239,7 +290,7 @@ class VectorScheduleAgent:
         # If confidence is too low, try LLM fallback
         if confidence < similarity_threshold:
             if self.llm:
-                return self.llm_fallback(user_query)
+                return self.llm_fallback(user_query, df)
             else:
                 return f"Low confidence match ({confidence:.3f}). Please be more specific or rephrase your query."
         
@@ -258,7 +309,7 @@ class VectorScheduleAgent:
             return f"Function '{intent}' not implemented."
         
         try:
-            result = self.function_map[intent](self.df, **extracted_params)
+            result = self.function_map[intent](df, **extracted_params)
             
             if isinstance(result, pd.DataFrame):
                 if not result.empty:
@@ -271,11 +322,13 @@ class VectorScheduleAgent:
         except Exception as e:
             return f"Error executing '{intent}': {str(e)}"
     
-    def llm_fallback(self, user_query):
+    def llm_fallback(self, user_query, df = None):
         ##FALLBACK TO LLM IF VECTOR BASED SIMILARITY IS LOW OR NO MATCH FOUND
         if not self.llm:
             return "LLM fallback not available."
         
+        if df is None:
+            df = self.df
         function_list = ", ".join(self.function_map.keys())
         system_prompt = f"""
         You are a scheduling assistant. Based on the user's query, extract the intent and parameters.
@@ -304,7 +357,7 @@ class VectorScheduleAgent:
                 params = parsed_json.get("parameters", {})
                 
                 if intent in self.function_map:
-                    result = self.function_map[intent](self.df, **params)
+                    result = self.function_map[intent](df, **params)
                     if isinstance(result, pd.DataFrame) and not result.empty:
                         return result
                     else:
@@ -315,6 +368,16 @@ class VectorScheduleAgent:
             return f"LLM fallback error: {str(e)}"
 
 
+# Test queries (also the default workload for replay_queries.py)
+TEST_QUERIES = [
+    "Show me all Security shifts on 2025-04-01",
+    "What is Charlie's schedule on 2025-04-01?",
+    "List all Stock shifts?",
+    "Who is working at Warehouse on 2025-04-01?",
+    "Add a shift for Alice on 2025-04-02 from 09:00 to 17:00", #Not working correctly
+    "Update Bob's shift on 2025-04-01 to start at 15:00" #Not working correctly
+]
+
 # Example usage and testing
 def main():
     # File paths
@@ -324,18 +387,8 @@ def main():
     # Initialize enhanced agent
     agent = VectorScheduleAgent(csv_file_path, examples_json_path)
     
-    # Test queries
-    test_queries = [
-        "Show me all Security shifts on 2025-04-01",
-        "What is Charlie's schedule on 2025-04-01?",
-        "List all Stock shifts?",
-        "Who is working at Warehouse on 2025-04-01?",
-        "Add a shift for Alice on 2025-04-02 from 09:00 to 17:00", #Not working correctly
-        "Update Bob's shift on 2025-04-01 to start at 15:00" #Not working correctly
-    ]
-    
     print("=== Test queries execution ===")
-    for query in test_queries:
+    for query in TEST_QUERIES:
         print(f"\nQuery: {query}")
         result = agent.process_user_query(query)
         if isinstance(result, pd.DataFrame):
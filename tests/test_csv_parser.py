@@ -0,0 +1,45 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from csv_parser import clean_schedule_df, diff_schedule_df
+
+HEADER = "Employee Name,Date,Start Time,End Time,Shift Type,Hours,Location,Role,Manager\n"
+
+def load(tmp_path, rows):
+    csv_path = tmp_path / "shift_schedule.csv"
+    csv_path.write_text(HEADER + "".join(row + "\n" for row in rows))
+    return clean_schedule_df(str(csv_path))
+
+def test_diff_with_repeated_keys(tmp_path):
+    old_df = load(tmp_path, [
+        "Alice,2025-04-01,09:00,17:00,Morning,8,Store A,Cashier,Sue",
+        "Alice,2025-04-01,09:00,17:00,Morning,8,Store B,Cashier,Sue",
+        "Bob,2025-04-01,,23:00,Afternoon,8,Warehouse,Stock,Sue",
+    ])
+    new_df = load(tmp_path, [
+        "Alice,2025-04-01,09:00,17:00,Morning,8,Store C,Cashier,Sue",
+        "Alice,2025-04-01,09:00,17:00,Morning,8,Store B,Cashier,Sue",
+        "Bob,2025-04-01,,23:00,Afternoon,8,Warehouse,Stock,Sue",
+    ])
+
+    added, removed, changed = diff_schedule_df(old_df, new_df)
+    assert (len(added), len(removed), len(changed)) == (0, 0, 1)
+    assert list(changed["Location"]) == ["Store C"]
+
+def test_diff_removes_every_repeated_row(tmp_path):
+    old_df = load(tmp_path, [
+        "Alice,2025-04-01,09:00,17:00,Morning,8,Store A,Cashier,Sue",
+        "Alice,2025-04-01,09:00,17:00,Morning,8,Store B,Cashier,Sue",
+        "Bob,2025-04-01,15:00,23:00,Afternoon,8,Warehouse,Stock,Sue",
+    ])
+    new_df = load(tmp_path, [
+        "Bob,2025-04-01,15:00,23:00,Afternoon,8,Warehouse,Stock,Sue",
+        "Carl,2025-04-02,09:00,17:00,Morning,8,Store B,Security,Tom",
+    ])
+
+    added, removed, changed = diff_schedule_df(old_df, new_df)
+    assert list(removed.index.get_level_values("Employee Name")) == ["Alice", "Alice"]
+    assert list(added.index.get_level_values("Employee Name")) == ["Carl"]
+    assert changed.empty
@@ -0,0 +1,96 @@
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from replay_queries import StageRecorder, compare_to_baseline, intent_accuracy, load_query_log
+
+class FakeAgent:
+    # Mirrors the stages of VectorScheduleAgent.process_user_query without the model.
+    def __init__(self):
+        self.function_map = {"get_shifts_by_role": self.get_shifts_by_role}
+
+    def get_shifts_by_role(self, role):
+        time.sleep(0.02)
+        return role
+
+    def find_similar_intent(self, user_query, top_k = 3):
+        return [({"user_query": user_query}, 0.25)]
+
+    def extract_parameters_from_query(self, user_query, template_params):
+        return template_params
+
+    def llm_fallback(self, user_query, df = None):
+        time.sleep(0.01)
+        return self.function_map["get_shifts_by_role"]("Stock")
+
+    def process_user_query(self, user_query):
+        self.find_similar_intent(user_query)
+        return self.llm_fallback(user_query)
+
+def make_result(query, intent = "get_shifts_by_role", total = 10.0, python_peak = 1000, **kwargs):
+    result = {
+        "user_query": query,
+        "expected_intent": None,
+        "intent": intent,
+        "latency_ms": {"vector_search": 5.0, "function_call": 5.0, "total": total},
+        "python_peak_bytes": python_peak,
+        "rss_peak_increase_bytes": 0
+    }
+    result.update(kwargs)
+    return result
+
+def test_stage_recorder_times_nested_stages_exclusively():
+    agent = FakeAgent()
+    recorder = StageRecorder(agent)
+    agent.process_user_query("Stock shifts")
+
+    assert recorder.intent == "get_shifts_by_role"
+    assert recorder.confidence == 0.25
+    assert recorder.used_llm_fallback
+    assert 0.02 <= recorder.timings["function_call"] < 0.03
+    assert 0.01 <= recorder.timings["llm_fallback"] < 0.02
+
+def test_load_query_log_json_and_jsonl(tmp_path):
+    json_path = tmp_path / "log.json"
+    json_path.write_text(json.dumps([{"user_query": "a", "intent": "f"}, {"intent": "no query"}]))
+    jsonl_path = tmp_path / "log.jsonl"
+    jsonl_path.write_text('{"query": "b", "expected_intent": "g", "intent": "ignored", "llm_response": "x"}\n\n')
+
+    assert load_query_log(str(json_path)) == [{"user_query": "a", "intent": "f", "llm_response": None}]
+    assert load_query_log(str(jsonl_path)) == [{"user_query": "b", "intent": "g", "llm_response": "x"}]
+
+def test_intent_accuracy_counts_labelled_queries_only():
+    results = [
+        make_result("a", expected_intent="get_shifts_by_role"),
+        make_result("b", expected_intent="get_shifts_by_date"),
+        make_result("c")
+    ]
+    assert intent_accuracy(results) == 0.5
+    assert intent_accuracy([make_result("c")]) is None
+
+def test_compare_to_baseline_ignores_noise():
+    baseline = {"results": [make_result("a", python_peak=0)]}
+    results = [make_result("a", total=14.0, python_peak=10)]
+    assert compare_to_baseline(results, baseline) == []
+
+def test_compare_to_baseline_reports_regressions():
+    baseline = {"intent_accuracy": 1.0, "results": [make_result("a"), make_result("b")]}
+    slow_stage = make_result("a", intent="get_shifts_by_date", python_peak=1_000_000, expected_intent="get_shifts_by_role")
+    slow_stage["latency_ms"]["vector_search"] = 50.0
+
+    regressions = compare_to_baseline([slow_stage], baseline)
+    assert regressions == [
+        "Query #1 'b' is in the baseline but was not replayed",
+        "Intent changed for 'a': get_shifts_by_role -> get_shifts_by_date",
+        "Latency regressed for 'a' (vector_search): 5.0 ms -> 50.0 ms",
+        "Python heap peak regressed for 'a': 1000 B -> 1000000 B",
+        "Intent accuracy dropped: 1.000 -> 0.000"
+    ]
+
+def test_compare_to_baseline_checks_every_repeat_of_a_query():
+    baseline = {"results": [make_result("a"), make_result("a")]}
+    results = [make_result("a"), make_result("a", intent="get_shifts_by_date")]
+    assert compare_to_baseline(results, baseline) == ["Intent changed for 'a': get_shifts_by_role -> get_shifts_by_date"]
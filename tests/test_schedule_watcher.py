@@ -0,0 +1,65 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from schedule_watcher import ScheduleFileWatcher, file_signature
+
+POLL_INTERVAL = 0.02
+
+def rewrite(path, text):
+    path.write_text(text)
+    # Make sure the rewrite changes the signature even on filesystems with coarse timestamps
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(POLL_INTERVAL)
+    return False
+
+def test_reports_a_settled_change_once(tmp_path):
+    path = tmp_path / "shift_schedule.csv"
+    path.write_text("a")
+    calls = []
+    watcher = ScheduleFileWatcher(str(path), lambda p: calls.append(p) or True, POLL_INTERVAL).start()
+    try:
+        rewrite(path, "ab")
+        assert wait_for(lambda: calls)
+        time.sleep(POLL_INTERVAL * 5)
+        assert calls == [str(path)]
+    finally:
+        watcher.stop()
+
+def test_retries_until_change_is_handled(tmp_path):
+    path = tmp_path / "shift_schedule.csv"
+    path.write_text("a")
+    results = [False, False, True]
+    calls = []
+    def on_change(p):
+        calls.append(p)
+        return results[len(calls) - 1]
+    watcher = ScheduleFileWatcher(str(path), on_change, POLL_INTERVAL).start()
+    try:
+        rewrite(path, "ab")
+        assert wait_for(lambda: len(calls) == 3)
+        time.sleep(POLL_INTERVAL * 5)
+        assert len(calls) == 3
+    finally:
+        watcher.stop()
+
+def test_reports_change_made_before_start(tmp_path):
+    path = tmp_path / "shift_schedule.csv"
+    path.write_text("a")
+    loaded_signature = file_signature(str(path))
+    rewrite(path, "ab")
+    calls = []
+    watcher = ScheduleFileWatcher(str(path), lambda p: calls.append(p) or True, POLL_INTERVAL, loaded_signature).start()
+    try:
+        assert wait_for(lambda: calls)
+    finally:
+        watcher.stop()
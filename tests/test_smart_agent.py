@@ -0,0 +1,78 @@
+import os
+import sys
+import time
+from datetime import date
+
+import pytest
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+# The Groq client is created on import; these tests never call it
+os.environ.setdefault("GROQ_API_KEY", "test")
+pytest.importorskip("sentence_transformers")
+pytest.importorskip("faiss")
+pytest.importorskip("langchain_groq")
+
+import smart_agent
+from csv_parser import clean_schedule_df
+from shift_functions import reassign_shift
+
+HEADER = "Employee Name,Date,Start Time,End Time,Shift Type,Hours,Location,Role,Manager\n"
+ALICE = "Alice,2025-04-01,09:00,17:00,Morning,8,Store A,Cashier,Sue"
+BOB = "Bob,2025-04-01,15:00,23:00,Afternoon,8,Warehouse,Stock,Sue"
+CARL = "Carl,2025-04-02,09:00,17:00,Morning,8,Store B,Security,Tom"
+
+def write_schedule(csv_path, rows):
+    csv_path.write_text(HEADER + "".join(row + "\n" for row in rows))
+    # Make sure every rewrite changes the file signature even with coarse timestamps
+    stat = os.stat(csv_path)
+    os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "shift_schedule.csv"
+    write_schedule(path, [ALICE, BOB])
+    return path
+
+@pytest.fixture
+def agent(csv_path, monkeypatch):
+    # Use the committed vector database and skip loading the embedding model
+    monkeypatch.setattr(smart_agent, "SentenceTransformer", lambda model_name: None)
+    agent = smart_agent.VectorScheduleAgent(str(csv_path), os.path.join(REPO_DIR, "examples.json"),
+                                            os.path.join(REPO_DIR, "schedule_vector_db"))
+    yield agent
+    agent.stop_schedule_watcher()
+
+def test_reload_schedule_matches_fresh_load(agent, csv_path):
+    write_schedule(csv_path, [CARL, BOB])
+
+    assert agent.reload_schedule() == "Schedule reloaded: 1 added, 1 removed, 0 changed."
+    assert agent.df.equals(clean_schedule_df(str(csv_path)))
+    assert agent.employee_name_list == ["Carl", "Bob"]
+
+def test_reload_schedule_after_in_place_edit(agent, csv_path):
+    reassign_shift(agent.df, "Alice", "Dana", date(2025, 4, 1))
+    write_schedule(csv_path, [ALICE, BOB, CARL])
+
+    agent.reload_schedule()
+    assert agent.df.equals(clean_schedule_df(str(csv_path)))
+    assert agent.employee_name_list == ["Alice", "Bob", "Carl"]
+
+def test_reload_schedule_keeps_frame_when_csv_is_unreadable(agent, csv_path):
+    loaded_df = agent.df
+    csv_path.write_text("not,a,schedule\n")
+
+    assert agent.reload_schedule() == "Schedule reload skipped: CSV could not be read."
+    assert agent.df is loaded_df
+    assert agent.employee_name_list == ["Alice", "Bob"]
+
+def test_watcher_picks_up_rewrite_made_before_start(agent, csv_path):
+    write_schedule(csv_path, [ALICE, BOB, CARL])
+    agent.start_schedule_watcher(poll_interval=0.02)
+
+    deadline = time.monotonic() + 2.0
+    while "Carl" not in agent.employee_name_list and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert agent.employee_name_list == ["Alice", "Bob", "Carl"]
+    assert agent.df.equals(clean_schedule_df(str(csv_path)))